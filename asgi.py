@@ -0,0 +1,253 @@
+"""ASGI entry point serving the read endpoints on SQLAlchemy's asyncio engine.
+
+    uvicorn asgi:app --workers 4
+
+GET /api/tasks, /api/tasks/<id>, /api/tasks/stats and /api/users run as
+coroutines. A slow query waits on the database without holding a thread, so
+cheap reads don't queue behind it. Their responses (bodies, status codes,
+ETags) are the Flask endpoints' own. Every other route, writes and the SSE feed
+included, is handed to the Flask app on a thread pool, in the same process.
+
+The async engine uses DATABASE_URL with its async driver (aiosqlite or
+asyncpg), or ASYNC_DATABASE_URL if set, and the same DB_POOL_* settings.
+READ_REPLICA_URLS, the rate limits and MAX_IN_FLIGHT are used the same way as
+by the Flask app.
+Needs starlette, a2wsgi and the driver installed.
+"""
+from app import (create_app, engine_options, db, ArchivedTask, User, TASK_TABLES, select_task_version,
+                 select_row_version, list_tasks_query, include_archived, list_limit, merge_task_lists,
+                 select_task_rows, task_list_payload, dumps_task_rows, task_assignees, users_from_cache, cache_users,
+                 select_users, make_etag, task_event_id, stats_range, task_stats,
+                 counter_status_priority_counts, counter_completions_per_day, observe,
+                 request_counts, metrics_lock, reads_from_primary, PRIMARY_COOKIE, start_job_scheduler,
+                 admit, release_slot, refund_not_modified)
+import app as sync_app
+from a2wsgi import WSGIMiddleware
+from contextlib import asynccontextmanager
+from flask_jwt_extended import decode_token
+from flask_jwt_extended.exceptions import JWTExtendedException
+from jwt import ExpiredSignatureError, InvalidTokenError
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from starlette.applications import Starlette
+from starlette.responses import Response
+from starlette.routing import Mount, Route
+from werkzeug.http import parse_etags
+import os
+import random
+import time
+
+ASYNC_DRIVERS = {'sqlite': 'sqlite+aiosqlite', 'postgresql': 'postgresql+asyncpg'}
+
+
+def async_database_uri(uri):
+    # The same database through its asyncio driver
+    url = make_url(uri)
+    return url.set(drivername=ASYNC_DRIVERS.get(url.get_backend_name(), url.drivername))
+
+
+flask_app = create_app()
+database_uri = os.environ.get('ASYNC_DATABASE_URL') or async_database_uri(flask_app.config['SQLALCHEMY_DATABASE_URI'])
+engine = create_async_engine(database_uri, **engine_options(str(database_uri)))
+replica_engines = [create_async_engine(async_database_uri(url), **engine_options(url))
+                   for url in flask_app.config['READ_REPLICA_URLS']]
+Session = async_sessionmaker(engine, expire_on_commit=False)
+
+
+def read_session(request, user_id):
+    # Session on a random replica unless the caller has to read from the primary
+    if replica_engines and not reads_from_primary(request.cookies.get(PRIMARY_COOKIE), user_id,
+                                                  flask_app.config['READ_YOUR_WRITES_SECONDS']):
+        return Session(bind=random.choice(replica_engines))
+    return Session()
+
+
+def json_response(payload, status=200, etag=None, headers=None, body=None):
+    # Encoded by the Flask app's JSON provider, so the bytes match the Flask endpoints,
+    # unless the body comes already encoded
+    if body is None:
+        body = flask_app.json.response(payload).get_data()
+    response = Response(body, status_code=status, headers=headers, media_type='application/json')
+    if etag:
+        with_etag(response, etag)
+    return response
+
+
+def with_etag(response, etag):
+    response.headers['ETag'] = f'"{etag}"'
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+def not_modified(request, etag, headers=None):
+    # Bare 304 if the client's If-None-Match already has this ETag, else None
+    if parse_etags(request.headers.get('If-None-Match')).contains_weak(etag):
+        return with_etag(Response(status_code=304, headers=headers), etag)
+    return None
+
+
+def jwt_identity(request):
+    # (identity, None) for a valid access token, else (None, the error response
+    # flask_jwt_extended's jwt_required() gives)
+    scheme, _, token = request.headers.get('Authorization', '').partition(' ')
+    if not token:
+        return None, json_response({'msg': 'Missing Authorization Header'}, 401)
+    if scheme != 'Bearer':
+        return None, json_response({'msg': "Missing 'Bearer' type in 'Authorization' header. "
+                                           "Expected 'Authorization: Bearer <JWT>'"}, 401)
+
+    try:
+        claims = decode_token(token)
+    except ExpiredSignatureError:
+        return None, json_response({'msg': 'Token has expired'}, 401)
+    except (InvalidTokenError, JWTExtendedException) as e:
+        return None, json_response({'msg': str(e)}, 422)
+
+    if claims.get('type') != 'access':
+        return None, json_response({'msg': 'Only non-refresh tokens are allowed'}, 422)
+    return claims[flask_app.config['JWT_IDENTITY_CLAIM']], None
+
+
+def read_endpoint(rule):
+    # Route for a `async def endpoint(request, session, user_id)`, called with a database
+    # session inside a Flask app context once the JWT checks out and admission control
+    # lets it through. Requests are counted in the Flask app's /metrics under the Flask rule.
+    def decorator(endpoint):
+        flask_endpoint = f'api.{endpoint.__name__}'
+
+        async def handle(request):
+            started = time.perf_counter()
+            with flask_app.app_context():
+                user_id, response = jwt_identity(request)
+                refused = response is None and admit(flask_endpoint, rule, user_id, request.query_params)
+                if refused:
+                    body, status, headers = refused
+                    response = json_response(body, status, headers=headers)
+                elif response is None:
+                    try:
+                        async with read_session(request, user_id) as session:
+                            response = await endpoint(request, session, user_id)
+                        if response.status_code == 304:
+                            refund_not_modified(flask_endpoint, user_id, request.query_params)
+                    finally:
+                        release_slot(flask_endpoint)
+
+                labels = (rule, request.method)
+                observe('http_request_duration_seconds', labels, time.perf_counter() - started)
+                with metrics_lock:
+                    request_counts[labels + (str(response.status_code),)] += 1
+            return response
+
+        path = rule.replace('<int:', '{').replace('>', ':int}')
+        routes.append(Route(path, handle, methods=['GET']))
+        return endpoint
+    return decorator
+
+
+async def users_for(session, tasks):
+    # Assignees of the tasks as serialize_tasks wants them, through the user cache
+    users, missing = users_from_cache(task_assignees(tasks))
+    if missing:
+        users.update(cache_users(await session.execute(select_users(missing))))
+    return users
+
+
+async def current_task_version(session):
+    return (await session.execute(select_task_version())).scalar() or 0
+
+
+routes = []
+
+
+@read_endpoint('/api/tasks')
+async def get_tasks(request, session, user_id):
+    event_headers = {'X-Task-Event-ID': task_event_id(sync_app.task_events_seq)}
+
+    etag = make_etag('tasks', await current_task_version(session), request.url.query)
+    cached = not_modified(request, etag, event_headers)
+    if cached:
+        return cached
+
+    try:
+        query, page_size = list_tasks_query(select_task_rows(), request.query_params)
+        if include_archived(request.query_params):
+            archived, _ = list_tasks_query(select_task_rows(ArchivedTask), request.query_params, ArchivedTask)
+    except ValueError as e:
+        return json_response({'detail': str(e)}, 400)
+
+    rows = (await session.execute(query)).all()
+    if include_archived(request.query_params):
+        rows = merge_task_lists(rows, (await session.execute(archived)).all(),
+                                list_limit(request.query_params, page_size))
+    return json_response(None, etag=etag, headers=event_headers,
+                         body=dumps_task_rows(task_list_payload(rows, page_size)))
+
+
+@read_endpoint('/api/tasks/<int:task_id>')
+async def get_task(request, session, user_id):
+    task_id = request.path_params['task_id']
+    for model in TASK_TABLES:
+        version = (await session.execute(select_row_version(model, task_id))).first()
+        if version:
+            break
+    else:
+        return json_response({'detail': 'Task not found'}, 404)
+
+    users = await users_for(session, [version])
+    assignee = users.get(version.assigned_user)
+    etag = make_etag('task', task_id, version.updated_at, assignee and assignee['full_name'])
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+
+    task = await session.get(model, task_id)
+
+    if not task:
+        return json_response({'detail': 'Task not found'}, 404)
+
+    return json_response(task.to_dict(users), etag=etag)
+
+
+@read_endpoint('/api/tasks/stats')
+async def get_task_stats(request, session, user_id):
+    my_tasks = request.query_params.get('my_tasks', 'false').lower() == 'true'
+
+    try:
+        range_start, range_end = stats_range(request.query_params)
+    except ValueError as e:
+        return json_response({'detail': str(e)}, 400)
+
+    etag = make_etag('stats', await current_task_version(session), user_id, my_tasks, range_start, range_end)
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+
+    rows = (await session.execute(counter_status_priority_counts(user_id))).all()
+    per_day = (await session.execute(counter_completions_per_day(range_start, range_end))).all()
+
+    return json_response(task_stats(rows, per_day, my_tasks, range_start, range_end), etag=etag)
+
+
+@read_endpoint('/api/users')
+async def get_users(request, session, user_id):
+    rows = await session.execute(db.select(User.id, User.full_name, User.email))
+    return json_response([{
+        'id': id,
+        'full_name': full_name,
+        'email': email
+    } for id, full_name, email in rows])
+
+
+@asynccontextmanager
+async def lifespan(app):
+    # Requests served here never reach the Flask hook that starts the jobs
+    with flask_app.app_context():
+        start_job_scheduler()
+    yield
+    for async_engine in [engine] + replica_engines:
+        await async_engine.dispose()
+
+
+# Anything the routes above don't take falls through to the Flask app
+routes.append(Mount('/', WSGIMiddleware(flask_app)))
+app = Starlette(routes=routes, lifespan=lifespan)
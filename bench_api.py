@@ -0,0 +1,225 @@
+"""Benchmark the API endpoints with concurrent clients and diff against a baseline.
+
+Seeds the database from DATABASE_URL up to --users/--tasks (plus the demo data
+used to log in), serves the app on a local threaded server and drives each
+endpoint in turn for --duration seconds. Reports throughput, p50/p95/p99 latency
+and SQL queries per request. Point it at a scratch database:
+
+    DATABASE_URL=sqlite:///bench.db python bench_api.py --tasks 100000 --output bench.json
+    DATABASE_URL=sqlite:///bench.db python bench_api.py --tasks 100000 --baseline bench.json
+
+With --baseline it exits non-zero if an endpoint's throughput, p50 or p95 got
+worse than the baseline by more than --tolerance, or it makes more queries.
+"""
+from app import create_app, db, Task, User, seed_demo, seed_synthetic, DEMO_USERS, DEMO_PASSWORD
+from datetime import datetime
+from sqlalchemy import event
+from werkzeug.serving import make_server
+import argparse
+import json
+import logging
+import random
+import statistics
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+
+# The benchmarks drive the server as one user well past any sane rate, so admission control is off
+UNLIMITED = {'RATE_LIMIT_ENABLED': False, 'MAX_IN_FLIGHT': 0}
+
+
+def call(url, body=None, token=None, method=None):
+    # Returns the HTTP status, the parsed JSON body and the latency in seconds
+    request = urllib.request.Request(url, data=json.dumps(body).encode() if body is not None else None,
+                                     headers={'Content-Type': 'application/json'}, method=method)
+    if token:
+        request.add_header('Authorization', f'Bearer {token}')
+
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request) as response:
+            status, payload = response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        status, payload = e.code, None
+    return status, payload, time.perf_counter() - started
+
+
+def run_clients(count, duration, work):
+    # Call work() from `count` threads until the duration is up, returns each call's result
+    results = []
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def client():
+        while time.perf_counter() < deadline:
+            result = work()
+            with lock:
+                results.append(result)
+
+    threads = [threading.Thread(target=client) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def percentile(values, pct):
+    return statistics.quantiles(values, n=100)[pct - 1] * 1000 if len(values) > 1 else float('nan')
+
+
+def endpoints(base, token, task_ids, rng):
+    # name -> work() making one request
+    def random_task():
+        return rng.choice(task_ids)
+
+    return {
+        'login': lambda: call(f'{base}/api/auth/login', {'email': DEMO_USERS[0][1], 'password': DEMO_PASSWORD}),
+        'list_tasks': lambda: call(f'{base}/api/tasks?page_size=50', token=token),
+        'get_task': lambda: call(f'{base}/api/tasks/{random_task()}', token=token),
+        'create_task': lambda: call(f'{base}/api/tasks', {
+            'title': 'Bench task', 'description': 'Created by bench_api.py',
+            'priority': rng.choice(['low', 'medium', 'high', 'critical'])
+        }, token=token),
+        'update_task': lambda: call(f'{base}/api/tasks/{random_task()}', {
+            'priority': rng.choice(['low', 'medium', 'high', 'critical']),
+            'status': rng.choice(['todo', 'in_progress'])
+        }, token=token, method='PUT'),
+        'complete_task': lambda: call(f'{base}/api/tasks/{random_task()}/complete', {}, token=token, method='PUT'),
+        'stats': lambda: call(f'{base}/api/tasks/stats', token=token),
+        'users': lambda: call(f'{base}/api/users', token=token),
+    }
+
+
+def measure(clients, duration, work, queries):
+    # Run one endpoint and summarize it
+    before = queries[0]
+    started = time.perf_counter()
+    results = run_clients(clients, duration, work)
+    elapsed = time.perf_counter() - started
+
+    latencies = [latency for _, _, latency in results]
+    return {
+        'requests': len(results),
+        'throughput': len(results) / elapsed,
+        'p50_ms': percentile(latencies, 50),
+        'p95_ms': percentile(latencies, 95),
+        'p99_ms': percentile(latencies, 99),
+        'queries_per_request': (queries[0] - before) / len(results) if results else 0,
+        'errors': sum(1 for status, _, _ in results if status >= 400)
+    }
+
+
+def regressions(results, baseline, tolerance):
+    # Human readable list of what got worse than the baseline
+    found = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+
+        if result['throughput'] < base['throughput'] * (1 - tolerance):
+            found.append(f"{name}: throughput {result['throughput']:.1f} < {base['throughput']:.1f} req/s")
+        # p99 is reported but too noisy over short runs to gate on
+        for key in ('p50_ms', 'p95_ms'):
+            if result[key] > base[key] * (1 + tolerance):
+                found.append(f"{name}: {key} {result[key]:.1f} > {base[key]:.1f}")
+        # Query counts only drift a little with cache hits, an N+1 shows up as whole queries
+        if result['queries_per_request'] > base['queries_per_request'] + 0.5:
+            found.append(f"{name}: {result['queries_per_request']:.2f} > "
+                         f"{base['queries_per_request']:.2f} queries/request")
+        if result['errors'] and not base['errors']:
+            found.append(f"{name}: {result['errors']} errors")
+    return found
+
+
+def report(results, baseline=None):
+    print(f"{'endpoint':<14} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'queries':>8} {'errors':>7}")
+    for name, result in results.items():
+        print(f"{name:<14} {result['throughput']:8.1f} {result['p50_ms']:8.1f} {result['p95_ms']:8.1f} "
+              f"{result['p99_ms']:8.1f} {result['queries_per_request']:8.2f} {result['errors']:7d}")
+
+        base = (baseline or {}).get(name)
+        if base:
+            print(f"{'  baseline':<14} {base['throughput']:8.1f} {base['p50_ms']:8.1f} {base['p95_ms']:8.1f} "
+                  f"{base['p99_ms']:8.1f} {base['queries_per_request']:8.2f} {base['errors']:7d}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=100, help='number of users to seed up to')
+    parser.add_argument('--tasks', type=int, default=10000, help='number of tasks to seed up to')
+    parser.add_argument('--seed', type=int, default=2307, help='random seed for the data and the requests')
+    parser.add_argument('--clients', type=int, default=8, help='concurrent clients per endpoint')
+    parser.add_argument('--duration', type=float, default=10, help='seconds per endpoint')
+    parser.add_argument('--endpoints', help='comma separated subset of the endpoints to run')
+    parser.add_argument('--output', help='write the results as JSON, e.g. to store a baseline')
+    parser.add_argument('--baseline', help='JSON results to diff against')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed relative slowdown, default 0.2')
+    args = parser.parse_args()
+
+    app = create_app(UNLIMITED)
+    with app.app_context():
+        db.create_all()
+        seed_demo()
+        # Fixed end date so the same seed gives the same data
+        seed_synthetic(max(args.users - User.query.count(), 0), max(args.tasks - Task.query.count(), 0),
+                       seed=args.seed, end=datetime(2026, 1, 1))
+        task_ids = [task_id for task_id, in db.session.query(Task.id)]
+        dialect = db.engine.dialect.name
+
+        queries = [0]
+        queries_lock = threading.Lock()
+
+        @event.listens_for(db.engine, 'before_cursor_execute')
+        def count_query(*args):
+            with queries_lock:
+                queries[0] += 1
+
+    # Keep the per-request access log out of the report
+    logging.getLogger('werkzeug').setLevel(logging.WARNING)
+    server = make_server('127.0.0.1', 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f'http://127.0.0.1:{server.server_port}'
+
+    status, payload, _ = call(f'{base}/api/auth/login', {'email': DEMO_USERS[0][1], 'password': DEMO_PASSWORD})
+    if status != 200:
+        print(f'Login failed with {status}')
+        return 1
+
+    work = endpoints(base, payload['access_token'], task_ids, random.Random(args.seed))
+    names = args.endpoints.split(',') if args.endpoints else list(work)
+    unknown = set(names) - set(work)
+    if unknown:
+        print(f"Unknown endpoints: {', '.join(sorted(unknown))}, expected some of {', '.join(work)}")
+        return 1
+
+    print(f'{dialect}, {len(task_ids)} tasks, {args.clients} clients, {args.duration:g}s per endpoint')
+    results = {name: measure(args.clients, args.duration, work[name], queries) for name in names}
+    server.shutdown()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+
+    report(results, baseline)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'dialect': dialect, 'tasks': len(task_ids), 'clients': args.clients,
+                       'results': results}, f, indent=2)
+
+    if baseline:
+        found = regressions(results, baseline, args.tolerance)
+        for line in found:
+            print(f'REGRESSION {line}')
+        return 1 if found else 0
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
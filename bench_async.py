@@ -0,0 +1,89 @@
+"""Compare how the sync (flask serve) and async (asgi.py) read paths scale with concurrency.
+
+Seeds the database from DATABASE_URL like bench_api.py, then starts each server
+with one worker process. For every --load level it runs that many clients on a
+heavy read (--heavy) while --probes clients fetch single tasks, and reports the
+heavy endpoint's throughput next to the single task latency:
+
+    DATABASE_URL=sqlite:///bench.db python bench_async.py --tasks 100000 --load 4,16,64
+
+With a fixed thread count the sync server queues the cheap reads behind the heavy
+ones once the load passes --threads; the async server keeps taking them.
+"""
+from app import create_app, db, Task, User, seed_demo, seed_synthetic, DEMO_USERS, DEMO_PASSWORD
+from bench_api import call, run_clients, percentile, endpoints
+from bench_serve import free_port, start, stop
+from datetime import datetime
+import argparse
+import random
+import sys
+import threading
+import time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=100, help='number of users to seed up to')
+    parser.add_argument('--tasks', type=int, default=10000, help='number of tasks to seed up to')
+    parser.add_argument('--seed', type=int, default=2307, help='random seed for the data and the requests')
+    parser.add_argument('--threads', type=int, default=4, help='flask serve threads')
+    parser.add_argument('--load', default='1,4,16,64', help='comma separated client counts on the heavy endpoint')
+    parser.add_argument('--heavy', default='list_tasks', help='heavy endpoint from bench_api.py')
+    parser.add_argument('--probes', type=int, default=2, help='clients fetching single tasks meanwhile')
+    parser.add_argument('--duration', type=float, default=10, help='seconds per load level')
+    args = parser.parse_args()
+
+    with create_app().app_context():
+        db.create_all()
+        seed_demo()
+        seed_synthetic(max(args.users - User.query.count(), 0), max(args.tasks - Task.query.count(), 0),
+                       seed=args.seed, end=datetime(2026, 1, 1))
+        task_ids = [task_id for task_id, in db.session.query(Task.id)]
+
+    servers = {
+        'sync': lambda port: [sys.executable, '-m', 'flask', '--app', 'app', 'serve', '--bind', f'127.0.0.1:{port}',
+                              '--workers', '1', '--threads', str(args.threads)],
+        'async': lambda port: [sys.executable, '-m', 'uvicorn', 'asgi:app', '--port', str(port),
+                               '--workers', '1', '--log-level', 'warning']
+    }
+
+    print(f'{len(task_ids)} tasks, heavy endpoint {args.heavy}, {args.probes} get_task probes, '
+          f'{args.duration:g}s per level, sync with {args.threads} threads')
+    print(f"{'server':<6} {'load':>5} {'heavy req/s':>12} {'heavy p95':>10} {'get_task p50':>13} "
+          f"{'get_task p95':>13} {'errors':>7}")
+
+    for server, command in servers.items():
+        port = free_port()
+        base = f'http://127.0.0.1:{port}'
+        process, _ = start(command(port), base)
+        try:
+            status, payload, _ = call(f'{base}/api/auth/login', {'email': DEMO_USERS[0][1], 'password': DEMO_PASSWORD})
+            if status != 200:
+                print(f'{server}: login failed with {status}')
+                return 1
+
+            work = endpoints(base, payload['access_token'], task_ids, random.Random(args.seed))
+            for load in [int(count) for count in args.load.split(',')]:
+                heavy = {}
+                started = time.perf_counter()
+                thread = threading.Thread(target=lambda: heavy.update(
+                    results=run_clients(load, args.duration, work[args.heavy])))
+                thread.start()
+                probes = run_clients(args.probes, args.duration, work['get_task'])
+                thread.join()
+                elapsed = time.perf_counter() - started
+
+                heavy_latencies = [latency for _, _, latency in heavy['results']]
+                probe_latencies = [latency for _, _, latency in probes]
+                errors = sum(1 for status, _, _ in heavy['results'] + probes if status >= 400)
+                print(f'{server:<6} {load:5d} {len(heavy_latencies) / elapsed:12.1f} '
+                      f'{percentile(heavy_latencies, 95):10.1f} {percentile(probe_latencies, 50):13.1f} '
+                      f'{percentile(probe_latencies, 95):13.1f} {errors:7d}')
+        finally:
+            stop(process)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""Measure login throughput next to concurrent GET /api/tasks latency.
+
+Serves the app on a local threaded server against DATABASE_URL (the demo data
+is loaded if missing), then runs task readers alone and again alongside a
+login storm:
+
+    DATABASE_URL=sqlite:///bench.db python bench_login.py --logins 16 --readers 4
+
+Compare runs with different PASSWORD_HASH_WORKERS / PASSWORD_HASH_METHOD, and
+use --bad-password to see repeated failed logins turned away without hashing.
+"""
+from app import create_app, db, seed_demo, DEMO_USERS, DEMO_PASSWORD
+from bench_api import call, run_clients, percentile, UNLIMITED
+from werkzeug.serving import make_server
+import argparse
+import logging
+import sys
+import threading
+
+
+def report(name, results, duration):
+    latencies = [latency for _, _, latency in results]
+    statuses = sorted({status for status, _, _ in results})
+    print(f'{name:<22} {len(results) / duration:8.1f} req/s   p50 {percentile(latencies, 50):7.1f} ms'
+          f'   p95 {percentile(latencies, 95):7.1f} ms   p99 {percentile(latencies, 99):7.1f} ms   status {statuses}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--logins', type=int, default=16, help='concurrent login clients')
+    parser.add_argument('--readers', type=int, default=4, help='concurrent GET /api/tasks clients')
+    parser.add_argument('--duration', type=float, default=10, help='seconds per phase')
+    parser.add_argument('--bad-password', action='store_true', help='log in with a wrong password')
+    args = parser.parse_args()
+
+    app = create_app(UNLIMITED)
+    with app.app_context():
+        db.create_all()
+        seed_demo()
+
+    # Keep the per-request access log out of the report
+    logging.getLogger('werkzeug').setLevel(logging.WARNING)
+    server = make_server('127.0.0.1', 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f'http://127.0.0.1:{server.server_port}'
+
+    email = DEMO_USERS[0][1]
+    status, payload, _ = call(f'{base}/api/auth/login', {'email': email, 'password': DEMO_PASSWORD})
+    if status != 200:
+        print(f'Login as {email} failed with {status}')
+        return 1
+    token = payload['access_token']
+
+    def read_tasks():
+        return call(f'{base}/api/tasks?limit=50', token=token)
+
+    def log_in():
+        password = 'wrong-password' if args.bad_password else DEMO_PASSWORD
+        return call(f'{base}/api/auth/login', {'email': email, 'password': password})
+
+    print(f"hash method {app.config['PASSWORD_HASH_METHOD']}, {app.config['PASSWORD_HASH_WORKERS']} hash workers")
+
+    report('tasks alone', run_clients(args.readers, args.duration, read_tasks), args.duration)
+
+    storm = {}
+    login_thread = threading.Thread(target=lambda: storm.update(
+        results=run_clients(args.logins, args.duration, log_in)))
+    login_thread.start()
+    tasks = run_clients(args.readers, args.duration, read_tasks)
+    login_thread.join()
+
+    report('tasks during logins', tasks, args.duration)
+    report('logins', storm['results'], args.duration)
+
+    server.shutdown()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""Compare building a large GET /api/tasks body from Task instances and from row tuples.
+
+Seeds the database from DATABASE_URL like bench_api.py, then serializes the
+first --rows tasks in list order --repeat times each way, from the query to the
+encoded bytes, and reports rows per second:
+
+    DATABASE_URL=sqlite:///bench.db python bench_serialize.py --tasks 100000 --rows 10000
+
+The ORM path is what GET /api/tasks did before: Task instances, to_dict() and
+jsonify(). The row path is what it does now: select_task_rows() and
+dumps_task_rows(), with orjson if it is installed. Both must give the same bytes.
+"""
+from app import (create_app, db, Task, User, TASK_ORDER, serialize_tasks, select_task_rows,
+                 task_row_dicts, dumps_task_rows, seed_demo, seed_synthetic)
+import app as tasks_app
+from datetime import datetime
+from flask import jsonify
+import argparse
+import sys
+import time
+
+
+def orm_body(rows):
+    tasks = Task.query.order_by(*TASK_ORDER).limit(rows).all()
+    body = jsonify(serialize_tasks(tasks)).get_data()
+    db.session.expunge_all()
+    return body
+
+
+def row_body(rows):
+    return dumps_task_rows(task_row_dicts(db.session.execute(select_task_rows().order_by(*TASK_ORDER).limit(rows))))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=100, help='number of users to seed up to')
+    parser.add_argument('--tasks', type=int, default=20000, help='number of tasks to seed up to')
+    parser.add_argument('--seed', type=int, default=2307, help='random seed for the data')
+    parser.add_argument('--rows', type=int, default=10000, help='tasks per response')
+    parser.add_argument('--repeat', type=int, default=5, help='responses to time each way')
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        seed_demo()
+        seed_synthetic(max(args.users - User.query.count(), 0), max(args.tasks - Task.query.count(), 0),
+                       seed=args.seed, end=datetime(2026, 1, 1))
+
+        ways = {'orm': orm_body, 'rows': row_body}
+        if tasks_app.orjson is not None:
+            ways['rows, no orjson'] = row_body
+
+        bodies, rates = {}, {}
+        print(f"{'path':<16} {'rows/s':>10} {'ms/response':>12}")
+        for name, build in ways.items():
+            saved = tasks_app.orjson
+            if name == 'rows, no orjson':
+                tasks_app.orjson = None
+            try:
+                bodies[name] = build(args.rows)
+                started = time.perf_counter()
+                for _ in range(args.repeat):
+                    build(args.rows)
+                elapsed = (time.perf_counter() - started) / args.repeat
+            finally:
+                tasks_app.orjson = saved
+
+            rates[name] = args.rows / elapsed
+            print(f'{name:<16} {rates[name]:10.0f} {elapsed * 1000:12.1f}')
+
+        print(f"rows path {rates['rows'] / rates['orm']:.1f}x the ORM path")
+        if any(body != bodies['orm'] for body in bodies.values()):
+            print('FAIL: the bodies differ')
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""Compare startup time and throughput of the debug server and `flask serve`.
+
+Seeds the database from DATABASE_URL up to --users/--tasks like bench_api.py,
+then starts each server as a subprocess, times how long it takes to answer its
+first request, and drives the chosen endpoints for --duration seconds:
+
+    DATABASE_URL=sqlite:///bench.db python bench_serve.py --tasks 100000 --workers 4
+
+The debug server is what `python app.py` runs; `flask serve` is gunicorn with
+--workers processes of --threads threads, each with its own connection pool.
+"""
+from app import create_app, db, Task, User, seed_demo, seed_synthetic, DEMO_USERS, DEMO_PASSWORD
+from bench_api import call, run_clients, percentile, endpoints, UNLIMITED
+from datetime import datetime
+import argparse
+import os
+import random
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start(command, base, timeout=60):
+    # Start a server and wait for its first response, returns the process and the seconds it took
+    started = time.perf_counter()
+    env = {**os.environ, **{key: str(value).lower() for key, value in UNLIMITED.items()}}
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=env,
+                               start_new_session=True)
+    while time.perf_counter() - started < timeout:
+        if process.poll() is not None:
+            raise RuntimeError(f"{' '.join(command)} exited with {process.returncode}")
+        try:
+            if call(f'{base}/api/datetime')[0] == 200:
+                return process, time.perf_counter() - started
+        except OSError:
+            time.sleep(0.05)
+    stop(process)
+    raise RuntimeError(f"{' '.join(command)} did not answer within {timeout}s")
+
+
+def stop(process):
+    # The debug server's reloader and gunicorn both fork, so stop the whole group
+    os.killpg(process.pid, signal.SIGTERM)
+    process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=100, help='number of users to seed up to')
+    parser.add_argument('--tasks', type=int, default=10000, help='number of tasks to seed up to')
+    parser.add_argument('--seed', type=int, default=2307, help='random seed for the data and the requests')
+    parser.add_argument('--workers', type=int, default=(os.cpu_count() or 1) * 2 + 1, help='flask serve workers')
+    parser.add_argument('--threads', type=int, default=4, help='flask serve threads per worker')
+    parser.add_argument('--clients', type=int, default=8, help='concurrent clients per endpoint')
+    parser.add_argument('--duration', type=float, default=10, help='seconds per endpoint')
+    parser.add_argument('--endpoints', default='list_tasks,stats', help='comma separated endpoints from bench_api.py')
+    args = parser.parse_args()
+
+    with create_app().app_context():
+        db.create_all()
+        seed_demo()
+        seed_synthetic(max(args.users - User.query.count(), 0), max(args.tasks - Task.query.count(), 0),
+                       seed=args.seed, end=datetime(2026, 1, 1))
+        task_ids = [task_id for task_id, in db.session.query(Task.id)]
+
+    flask = [sys.executable, '-m', 'flask', '--app', 'app']
+    servers = {
+        'debug': lambda port: flask + ['run', '--debug', '--port', str(port)],
+        'serve': lambda port: flask + ['serve', '--bind', f'127.0.0.1:{port}', '--workers', str(args.workers),
+                                       '--threads', str(args.threads)]
+    }
+
+    print(f'{len(task_ids)} tasks, {args.clients} clients, {args.duration:g}s per endpoint, '
+          f'serve with {args.workers} workers x {args.threads} threads')
+    print(f"{'server':<8} {'endpoint':<14} {'startup s':>9} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'errors':>7}")
+
+    for server, command in servers.items():
+        port = free_port()
+        base = f'http://127.0.0.1:{port}'
+        process, startup = start(command(port), base)
+        try:
+            status, payload, _ = call(f'{base}/api/auth/login', {'email': DEMO_USERS[0][1], 'password': DEMO_PASSWORD})
+            if status != 200:
+                print(f'{server}: login failed with {status}')
+                return 1
+
+            work = endpoints(base, payload['access_token'], task_ids, random.Random(args.seed))
+            for name in args.endpoints.split(','):
+                started = time.perf_counter()
+                results = run_clients(args.clients, args.duration, work[name])
+                elapsed = time.perf_counter() - started
+
+                latencies = [latency for _, _, latency in results]
+                errors = sum(1 for status, _, _ in results if status >= 400)
+                print(f'{server:<8} {name:<14} {startup:9.2f} {len(results) / elapsed:8.1f} '
+                      f'{percentile(latencies, 50):8.1f} {percentile(latencies, 95):8.1f} {errors:7d}')
+        finally:
+            stop(process)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""Run EXPLAIN on the task list, stats and background job queries and fail on sequential scans.
+
+Seeds the database from DATABASE_URL up to --tasks rows first, so point it at a
+scratch database:
+
+    DATABASE_URL=sqlite:///plans.db python check_query_plans.py --tasks 200000
+"""
+from app import (create_app, db, Task, ArchivedTask, User, filter_tasks,
+                 list_tasks_query, select_task_rows, encode_cursor, counter_status_priority_counts,
+                 counter_completions_per_day, seed_synthetic, search_tasks,
+                 newly_overdue, no_longer_overdue, due_for_reminder, due_for_archive)
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy import event
+import argparse
+import re
+import sys
+
+
+def seed(num_tasks, num_users=100):
+    # Top up users and tasks to the requested size with the `flask seed` generator
+    seed_synthetic(max(num_users - User.query.count(), 0), max(num_tasks - Task.query.count(), 0))
+
+    if db.engine.dialect.name == 'postgresql':
+        db.session.execute(db.text('ANALYZE tasks'))
+        db.session.execute(db.text('ANALYZE tasks_archive'))
+    else:
+        db.session.execute(db.text('ANALYZE'))
+    db.session.commit()
+
+
+@contextmanager
+def explain():
+    # Rewrite every statement executed inside the block into its EXPLAIN form
+    prefix = 'EXPLAIN ' if db.engine.dialect.name == 'postgresql' else 'EXPLAIN QUERY PLAN '
+
+    def rewrite(conn, cursor, statement, parameters, context, executemany):
+        return prefix + statement, parameters
+
+    event.listen(db.engine, 'before_cursor_execute', rewrite, retval=True)
+    try:
+        yield
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', rewrite)
+
+
+def plan_lines(query):
+    with explain():
+        rows = db.session.connection().execute(getattr(query, 'statement', query)).all()
+
+    # PostgreSQL returns one text line per row, SQLite (id, parent, notused, detail)
+    return [row[-1] for row in rows]
+
+
+def is_seq_scan(line):
+    return bool(re.search(r'Seq Scan on tasks(_archive)?\b', line) or
+                re.match(r'\s*SCAN (TABLE )?tasks(_archive)?\b(?! USING)', line))
+
+
+def checked_queries():
+    user_id = db.session.query(User.id).first()[0]
+    today = datetime.utcnow().date()
+    page_size = current_app.config['TASKS_PAGE_SIZE']
+    cursor = encode_cursor(Task.query.filter(Task.due_date.isnot(None)).first())
+
+    def get_tasks(model=Task, **args):
+        # The select GET /api/tasks runs for these query string arguments
+        return list_tasks_query(select_task_rows(model), {'page_size': page_size, **args}, model)[0]
+
+    return {
+        'get_tasks page': get_tasks(),
+        'get_tasks status': get_tasks(status='in_progress'),
+        'get_tasks assigned_user': get_tasks(assigned_user=user_id),
+        'get_tasks assigned_user+status': get_tasks(status='todo', assigned_user=user_id),
+        'get_tasks cursor': get_tasks(cursor=cursor),
+        'get_tasks include_archived': get_tasks(ArchivedTask, status='completed', assigned_user=user_id),
+        'search_tasks': search_tasks(Task.query, 'deploy')[0].limit(page_size),
+        'search_tasks status': search_tasks(filter_tasks(Task.query, status='todo'), 'deploy')[0].limit(page_size),
+        'get_task_stats counts': counter_status_priority_counts(user_id),
+        'get_task_stats completions': counter_completions_per_day(today - timedelta(days=today.weekday()), today),
+        'sweep_overdue flag': db.session.query(Task.id).filter(*newly_overdue(today)).limit(page_size),
+        'sweep_overdue clear': db.session.query(Task.id).filter(*no_longer_overdue(today)).limit(page_size),
+        'send_reminders': db.session.query(Task.id).filter(*due_for_reminder(today, 1)).limit(page_size),
+        'archive_completed': db.session.query(Task.id).filter(*due_for_archive(datetime.utcnow() - timedelta(days=90))).limit(page_size)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--tasks', type=int, default=200000, help='number of tasks to seed up to')
+    args = parser.parse_args()
+
+    failures = 0
+    with create_app().app_context():
+        db.create_all()
+        seed(args.tasks)
+
+        for name, query in checked_queries().items():
+            lines = plan_lines(query)
+            seq_scan = any(is_seq_scan(line) for line in lines)
+            failures += seq_scan
+
+            print(f"{'FAIL' if seq_scan else 'ok  '} {name}")
+            for line in lines:
+                print(f'       {line}')
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
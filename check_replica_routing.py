@@ -0,0 +1,80 @@
+"""Check that GET requests read from the replica and writers read their own writes.
+
+Sets up the demo data on a primary and a replica database separately, so the
+replica never sees the writes made through the API (a replica lagging forever),
+then checks which one each request reads from. Defaults to two SQLite files in a
+temporary directory; pass two scratch PostgreSQL databases to check those:
+
+    python check_replica_routing.py
+    python check_replica_routing.py --primary postgresql://localhost/tasks --replica postgresql://localhost/tasks_replica
+"""
+from app import create_app, setup_db, primary_pins, DEMO_USERS, DEMO_PASSWORD
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--primary', help='primary database URL, default a temporary SQLite file')
+    parser.add_argument('--replica', help='replica database URL, default a temporary SQLite file')
+    parser.add_argument('--window', type=float, default=1, help='READ_YOUR_WRITES_SECONDS to check with')
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    primary = args.primary or f"sqlite:///{os.path.join(directory, 'primary.db')}"
+    replica = args.replica or f"sqlite:///{os.path.join(directory, 'replica.db')}"
+
+    for url in (primary, replica):
+        with create_app({'SQLALCHEMY_DATABASE_URI': url, 'READ_REPLICA_URLS': []}).app_context():
+            setup_db()
+
+    app = create_app({'SQLALCHEMY_DATABASE_URI': primary, 'READ_REPLICA_URLS': [replica],
+                      'READ_YOUR_WRITES_SECONDS': args.window})
+
+    def client(email):
+        # Logged in test client and its auth header
+        test_client = app.test_client()
+        response = test_client.post('/api/auth/login', json={'email': email, 'password': DEMO_PASSWORD})
+        return test_client, {'Authorization': f"Bearer {response.get_json()['access_token']}"}
+
+    writer, writer_auth = client(DEMO_USERS[0][1])
+    reader, reader_auth = client(DEMO_USERS[1][1])
+    task_id = writer.post('/api/tasks', json={'title': 'Replica check'}, headers=writer_auth).get_json()['id']
+
+    checks = []
+
+    def check(name, test_client, auth, expected):
+        status = test_client.get(f'/api/tasks/{task_id}', headers=auth).status_code
+        checks.append((name, status == expected, f'{status}, expected {expected}'))
+
+    check('writer reads its write from the primary', writer, writer_auth, 200)
+    check('other users read from the replica', reader, reader_auth, 404)
+
+    # A writer served by another process only has the cookie
+    primary_pins.clear()
+    check('writer with the cookie reads from the primary', writer, writer_auth, 200)
+    check('writer without the cookie reads from the replica', app.test_client(), writer_auth, 404)
+
+    # A cookie pinning further ahead than the window wasn't set by us
+    forged = app.test_client()
+    forged.set_cookie('read_primary_until', f'{time.time() + 3600:.3f}')
+    check('a cookie beyond the window is ignored', forged, writer_auth, 404)
+
+    writer.post('/api/tasks', json={'title': 'Replica check 2'}, headers=writer_auth)
+    time.sleep(args.window + 0.1)
+    writer.delete_cookie('read_primary_until')
+    check('writer reads from the replica once the window is over', writer, writer_auth, 404)
+
+    failures = 0
+    for name, passed, detail in checks:
+        failures += not passed
+        print(f"{'ok  ' if passed else 'FAIL'} {name} ({detail})")
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,34 @@
+"""add task indexes
+
+Revision ID: 3f1c9a2b7d10
+Revises: 0b1d3f5a7c92
+Create Date: 2026-10-18 14:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c9a2b7d10'
+down_revision = '0b1d3f5a7c92'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The tables predate migrations (created by db.create_all), which also
+    # creates these indexes on fresh databases, hence if_not_exists
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.create_index('ix_tasks_assigned_user_status', ['assigned_user', 'status'], unique=False, if_not_exists=True)
+        batch_op.create_index('ix_tasks_status_completed_at', ['status', 'completed_at'], unique=False, if_not_exists=True)
+        batch_op.create_index('ix_tasks_status_priority_assigned_user', ['status', 'priority', 'assigned_user'], unique=False, if_not_exists=True)
+        batch_op.create_index('ix_tasks_due_date_id', ['due_date', 'id'], unique=False, if_not_exists=True)
+
+
+def downgrade():
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.drop_index('ix_tasks_due_date_id')
+        batch_op.drop_index('ix_tasks_status_priority_assigned_user')
+        batch_op.drop_index('ix_tasks_status_completed_at')
+        batch_op.drop_index('ix_tasks_assigned_user_status')
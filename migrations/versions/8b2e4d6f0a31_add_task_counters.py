@@ -0,0 +1,52 @@
+"""add task counters
+
+Revision ID: 8b2e4d6f0a31
+Revises: 3f1c9a2b7d10
+Create Date: 2026-10-18 15:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b2e4d6f0a31'
+down_revision = '3f1c9a2b7d10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('task_counters',
+    sa.Column('assigned_user', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('priority', sa.String(length=20), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('assigned_user', 'status', 'priority'),
+    if_not_exists=True
+    )
+    op.create_table('task_completion_days',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day'),
+    if_not_exists=True
+    )
+
+    # Fill from the existing tasks, same result as `flask reconcile-counters`
+    op.execute("DELETE FROM task_counters")
+    op.execute("DELETE FROM task_completion_days")
+    op.execute(
+        "INSERT INTO task_counters (assigned_user, status, priority, count) "
+        "SELECT COALESCE(assigned_user, 0), COALESCE(status, 'todo'), COALESCE(priority, 'medium'), COUNT(*) "
+        "FROM tasks GROUP BY 1, 2, 3"
+    )
+    op.execute(
+        "INSERT INTO task_completion_days (day, count) "
+        "SELECT date(completed_at), COUNT(*) FROM tasks "
+        "WHERE status = 'completed' AND completed_at IS NOT NULL GROUP BY 1"
+    )
+
+
+def downgrade():
+    op.drop_table('task_completion_days')
+    op.drop_table('task_counters')
@@ -0,0 +1,95 @@
+"""never reuse task ids on SQLite
+
+Revision ID: a7c9e1f3b5d8
+Revises: f2a4c6e8d0b1
+Create Date: 2026-10-19 10:20:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7c9e1f3b5d8'
+down_revision = 'f2a4c6e8d0b1'
+branch_labels = None
+depends_on = None
+
+COLUMNS = ('id, title, description, status, priority, created_at, due_date, assigned_user, '
+           'completed_at, updated_at, overdue, reminded_at, archived_at')
+
+INDEXES = [
+    "CREATE INDEX ix_tasks_assigned_user_status ON tasks (assigned_user, status)",
+    "CREATE INDEX ix_tasks_status_completed_at ON tasks (status, completed_at)",
+    "CREATE INDEX ix_tasks_status_priority_assigned_user ON tasks (status, priority, assigned_user)",
+    "CREATE INDEX ix_tasks_due_date_id ON tasks (due_date, id)",
+    "CREATE INDEX ix_tasks_open_due_date ON tasks (due_date) WHERE status != 'completed'",
+    "CREATE INDEX ix_tasks_overdue ON tasks (id) WHERE overdue = 1"
+]
+
+# Same triggers as app.SQLITE_SEARCH_DDL
+SEARCH_TRIGGERS = [
+    "CREATE TRIGGER tasks_fts_insert AFTER INSERT ON tasks BEGIN "
+    "INSERT INTO tasks_fts (rowid, title, description) VALUES (new.id, new.title, new.description); END",
+    "CREATE TRIGGER tasks_fts_delete AFTER DELETE ON tasks BEGIN "
+    "INSERT INTO tasks_fts (tasks_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); END",
+    "CREATE TRIGGER tasks_fts_update AFTER UPDATE OF title, description ON tasks BEGIN "
+    "INSERT INTO tasks_fts (tasks_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); "
+    "INSERT INTO tasks_fts (rowid, title, description) VALUES (new.id, new.title, new.description); END"
+]
+
+
+def rebuild_tasks(autoincrement):
+    # SQLite can't add AUTOINCREMENT to a table, so copy tasks into a new one. Ids are kept,
+    # so the search index still matches; its triggers and the indexes go with the old
+    # table and are created again.
+    primary_key = 'INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT' if autoincrement else 'INTEGER NOT NULL PRIMARY KEY'
+    op.execute(f"""
+        CREATE TABLE tasks_new (
+            id {primary_key},
+            title VARCHAR(100) NOT NULL,
+            description TEXT,
+            status VARCHAR(20),
+            priority VARCHAR(20),
+            created_at DATETIME,
+            due_date DATE,
+            assigned_user INTEGER REFERENCES users (id),
+            completed_at DATETIME,
+            updated_at DATETIME,
+            overdue BOOLEAN DEFAULT 0 NOT NULL,
+            reminded_at DATETIME,
+            archived_at DATETIME
+        )
+    """)
+    op.execute(f'INSERT INTO tasks_new ({COLUMNS}) SELECT {COLUMNS} FROM tasks')
+    op.execute('DROP TABLE tasks')
+    op.execute('ALTER TABLE tasks_new RENAME TO tasks')
+
+    for statement in INDEXES:
+        op.execute(statement)
+    if op.get_bind().exec_driver_sql("SELECT 1 FROM sqlite_master WHERE name = 'tasks_fts'").first():
+        for statement in SEARCH_TRIGGERS:
+            op.execute(statement)
+
+
+def upgrade():
+    # PostgreSQL sequences never hand an id out twice already
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    rebuild_tasks(autoincrement=True)
+
+    # Archived ids may be above every active one, keep them taken too
+    op.execute("INSERT INTO sqlite_sequence (name, seq) SELECT 'tasks', 0 "
+               "WHERE NOT EXISTS (SELECT 1 FROM sqlite_sequence WHERE name = 'tasks')")
+    op.execute("UPDATE sqlite_sequence SET seq = max(seq, (SELECT coalesce(max(id), 0) FROM tasks_archive)) "
+               "WHERE name = 'tasks'")
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    rebuild_tasks(autoincrement=False)
+    op.execute("DELETE FROM sqlite_sequence WHERE name = 'tasks'")
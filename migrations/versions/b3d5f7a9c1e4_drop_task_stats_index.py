@@ -0,0 +1,25 @@
+"""drop the stats aggregate index on tasks
+
+Revision ID: b3d5f7a9c1e4
+Revises: a7c9e1f3b5d8
+Create Date: 2026-10-19 11:30:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3d5f7a9c1e4'
+down_revision = 'a7c9e1f3b5d8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # GET /api/tasks/stats reads the counter tables, only `flask reconcile-counters` still groups
+    # tasks by status and priority, and it reads them all anyway
+    op.drop_index('ix_tasks_status_priority_assigned_user', table_name='tasks')
+
+
+def downgrade():
+    op.create_index('ix_tasks_status_priority_assigned_user', 'tasks', ['status', 'priority', 'assigned_user'])
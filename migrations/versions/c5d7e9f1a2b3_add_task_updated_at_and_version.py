@@ -0,0 +1,38 @@
+"""add task updated_at and version
+
+Revision ID: c5d7e9f1a2b3
+Revises: 8b2e4d6f0a31
+Create Date: 2026-10-18 16:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5d7e9f1a2b3'
+down_revision = '8b2e4d6f0a31'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('tasks') as batch_op:
+        batch_op.add_column(sa.Column('updated_at', sa.DateTime(), nullable=True))
+
+    # Last known change for existing tasks
+    op.execute("UPDATE tasks SET updated_at = COALESCE(completed_at, created_at)")
+
+    op.create_table('task_version',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    if_not_exists=True
+    )
+
+
+def downgrade():
+    op.drop_table('task_version')
+
+    with op.batch_alter_table('tasks') as batch_op:
+        batch_op.drop_column('updated_at')
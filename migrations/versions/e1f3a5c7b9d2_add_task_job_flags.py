@@ -0,0 +1,41 @@
+"""add task overdue, reminder and archive flags
+
+Revision ID: e1f3a5c7b9d2
+Revises: d8f0a2c4e6b5
+Create Date: 2026-10-18 19:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e1f3a5c7b9d2'
+down_revision = 'd8f0a2c4e6b5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Plain ALTER TABLE rather than batch mode, which would rebuild the table on SQLite and
+    # lose the search triggers
+    op.add_column('tasks', sa.Column('overdue', sa.Boolean(), nullable=False, server_default=sa.false()))
+    op.add_column('tasks', sa.Column('reminded_at', sa.DateTime(), nullable=True))
+    op.add_column('tasks', sa.Column('archived_at', sa.DateTime(), nullable=True))
+
+    # Open tasks by due date, for the overdue sweep and the reminders
+    op.create_index('ix_tasks_open_due_date', 'tasks', ['due_date'], if_not_exists=True,
+                    postgresql_where=sa.text("status != 'completed'"),
+                    sqlite_where=sa.text("status != 'completed'"))
+    # The few flagged tasks, for clearing stale flags
+    op.create_index('ix_tasks_overdue', 'tasks', ['id'], if_not_exists=True,
+                    postgresql_where=sa.text('overdue'), sqlite_where=sa.text('overdue = 1'))
+
+
+def downgrade():
+    op.drop_index('ix_tasks_overdue', table_name='tasks')
+    op.drop_index('ix_tasks_open_due_date', table_name='tasks')
+
+    op.drop_column('tasks', 'archived_at')
+    op.drop_column('tasks', 'reminded_at')
+    op.drop_column('tasks', 'overdue')
@@ -0,0 +1,21 @@
+from app import create_app, setup_db, DEMO_USERS, DEMO_PASSWORD
+import pytest
+
+
+@pytest.fixture
+def app(tmp_path):
+    # App on a temporary SQLite file with the demo data, no replicas or rate limits
+    app = create_app({'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'tasks.db'}", 'READ_REPLICA_URLS': [],
+                      'RATE_LIMIT_ENABLED': False})
+    with app.app_context():
+        setup_db()
+    return app
+
+
+@pytest.fixture
+def client(app):
+    # Test client logged in as the first demo user
+    client = app.test_client()
+    response = client.post('/api/auth/login', json={'email': DEMO_USERS[0][1], 'password': DEMO_PASSWORD})
+    client.environ_base['HTTP_AUTHORIZATION'] = f"Bearer {response.get_json()['access_token']}"
+    return client
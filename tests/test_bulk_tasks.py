@@ -0,0 +1,65 @@
+"""Bulk task endpoints answer per item: bad items get their own 400, the rest are applied."""
+from app import db, Task
+
+
+def task(app, task_id):
+    with app.app_context():
+        return db.session.get(Task, task_id)
+
+
+def statuses(response):
+    assert response.status_code == 200
+    return [result['status'] for result in response.get_json()['results']]
+
+
+def test_bulk_create_reports_each_item(app, client):
+    response = client.post('/api/tasks/bulk', json={'tasks': [
+        {'title': 'Valid', 'due_date': '2026-01-02', 'assigned_user': 2},
+        {'title': None},
+        {'title': ''},
+        {'title': 'Unknown assignee', 'assigned_user': 9999},
+        {'title': 'Bad date', 'due_date': 5},
+        {'title': 'Null status', 'status': None},
+        7,
+        {'title': 'Also valid'}
+    ]})
+
+    assert statuses(response) == [201, 400, 400, 400, 400, 400, 400, 201]
+    results = response.get_json()['results']
+    created = task(app, results[0]['task']['id'])
+    assert (created.title, created.assigned_user, str(created.due_date)) == ('Valid', 2, '2026-01-02')
+    assert task(app, results[7]['task']['id']).title == 'Also valid'
+
+
+def test_bulk_update_reports_each_item(app, client):
+    response = client.patch('/api/tasks/bulk', json={'tasks': [
+        {'id': 1, 'title': 'Renamed', 'status': 'completed'},
+        {'id': 2, 'title': None},
+        {'id': 3, 'assigned_user': 9999},
+        {'id': 99999, 'title': 'Missing'},
+        {'id': [4]},
+        {'id': 1, 'title': 'Duplicate'},
+        {'id': 5, 'priority': 'low'}
+    ]})
+
+    assert statuses(response) == [200, 400, 400, 404, 400, 400, 200]
+    assert (task(app, 1).title, task(app, 1).status) == ('Renamed', 'completed')
+    assert task(app, 1).completed_at is not None
+    assert task(app, 2).title
+    assert task(app, 3).assigned_user != 9999
+    assert task(app, 5).priority == 'low'
+
+
+def test_bulk_delete_reports_each_item(app, client):
+    response = client.delete('/api/tasks/bulk', json={'ids': [1, [2], 'x', 99999, 3]})
+
+    assert statuses(response) == [200, 400, 400, 404, 200]
+    assert task(app, 1) is None and task(app, 3) is None
+    assert task(app, 2) is not None
+
+
+def test_bulk_body_must_be_an_object(client):
+    for body in ([{'title': 'x'}], 5, 'tasks'):
+        assert client.post('/api/tasks/bulk', json=body).status_code == 400
+    assert client.patch('/api/tasks/bulk', json={'tasks': 'x'}).status_code == 400
+    assert client.delete('/api/tasks/bulk', json=[1]).status_code == 400
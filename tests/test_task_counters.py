@@ -0,0 +1,64 @@
+"""The task counters must match a fresh count of the tasks after every kind of write."""
+from app import db, run_job, TaskCounter, TaskCompletionDay
+from collections import Counter
+
+
+def fresh_counts():
+    # What `flask reconcile-counters` recounts: tasks and archived tasks grouped by assignee,
+    # status and priority, and completed ones by day
+    counts, days = Counter(), Counter()
+    for table in ('tasks', 'tasks_archive'):
+        counts.update({(user, status, priority): count for user, status, priority, count in db.session.execute(db.text(
+            f'SELECT coalesce(assigned_user, 0), status, priority, count(*) FROM {table} GROUP BY 1, 2, 3'))})
+        days.update({str(day): count for day, count in db.session.execute(db.text(
+            f"SELECT date(completed_at), count(*) FROM {table} "
+            f"WHERE status = 'completed' AND completed_at IS NOT NULL GROUP BY 1"))})
+    return counts, days
+
+
+def stored_counts():
+    counts = Counter({(c.assigned_user, c.status, c.priority): c.count for c in TaskCounter.query if c.count})
+    days = Counter({str(d.day): d.count for d in TaskCompletionDay.query if d.count})
+    return counts, days
+
+
+def assert_counters_match(app):
+    with app.app_context():
+        assert stored_counts() == fresh_counts()
+
+
+def test_counters_follow_every_write(app, client):
+    assert_counters_match(app)
+
+    # Single task endpoints
+    created = [client.post('/api/tasks', json={'title': f'Task {i}', 'priority': 'high', 'due_date': '2020-01-01',
+                                               'assigned_user': 1 + i % 3}).get_json()['id'] for i in range(4)]
+    client.put(f'/api/tasks/{created[0]}', json={'status': 'in_progress', 'priority': 'low'})
+    client.put(f'/api/tasks/{created[1]}', json={'assigned_user': None})
+    client.put(f'/api/tasks/{created[2]}/complete')
+    client.put(f'/api/tasks/{created[2]}', json={'status': 'todo'})
+    client.put(f'/api/tasks/{created[3]}', json={'status': 'completed'})
+    client.delete(f'/api/tasks/{created[0]}')
+    assert_counters_match(app)
+
+    # Bulk endpoints
+    results = client.post('/api/tasks/bulk', json={'tasks': [
+        {'title': 'Bulk 1', 'status': 'completed'}, {'title': 'Bulk 2', 'assigned_user': 2}, {'title': None}
+    ]}).get_json()['results']
+    bulk_ids = [result['task']['id'] for result in results if result['status'] == 201]
+    client.patch('/api/tasks/bulk', json={'tasks': [
+        {'id': bulk_ids[0], 'status': 'todo'}, {'id': bulk_ids[1], 'status': 'completed', 'priority': 'critical'},
+        {'id': 1, 'assigned_user': 3}, {'id': 2, 'title': None}
+    ]})
+    client.delete('/api/tasks/bulk', json={'ids': [bulk_ids[0], 99999]})
+    assert_counters_match(app)
+
+    # Background jobs, archiving every completed task
+    app.config['ARCHIVE_AFTER_DAYS'] = 0
+    with app.app_context():
+        assert run_job('sweep_overdue') > 0
+        assert run_job('archive_completed') > 0
+    assert_counters_match(app)
+
+    # Archived tasks are read-only, but the totals keep counting them
+    assert client.get('/api/tasks/stats').get_json()['completed'] > 0
@@ -0,0 +1,56 @@
+"""GET /api/tasks must cost the same number of queries however many tasks it returns.
+
+Run from the repository root:
+
+    python -m pytest -q tests
+"""
+from app import db, seed_synthetic
+from sqlalchemy import event
+import pytest
+
+
+def count_queries(app, client, url):
+    # Statements sent to the database while serving url, and the response
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', record)
+    try:
+        response = client.get(url)
+    finally:
+        event.remove(engine, 'before_cursor_execute', record)
+
+    assert response.status_code == 200
+    return len(statements), response.get_json()
+
+
+def top_up(app, num_users, num_tasks):
+    # Add tasks assigned across many more users, each one a different assignee to resolve
+    with app.app_context():
+        seed_synthetic(num_users, num_tasks)
+
+
+@pytest.mark.parametrize('url', [
+    '/api/tasks',
+    '/api/tasks?limit=500',
+    '/api/tasks?page_size=500',
+    '/api/tasks?status=todo',
+    '/api/tasks?include_archived=true'
+])
+def test_task_list_query_count_is_constant(app, client, url):
+    top_up(app, 5, 20)
+    small, payload = count_queries(app, client, url)
+
+    top_up(app, 100, 400)
+    large, more = count_queries(app, client, url)
+
+    def tasks(body):
+        return body['tasks'] if isinstance(body, dict) else body
+
+    assert len(tasks(more)) > len(tasks(payload))
+    assert all(task['assigned_user_name'] for task in tasks(more) if task['assigned_user'])
+    assert large == small
@@ -0,0 +1,7 @@
+"""WSGI entry point for production servers, e.g. `gunicorn -w 4 --threads 4 wsgi:app`.
+
+`flask serve` starts gunicorn with the same app and sensible defaults.
+"""
+from app import create_app
+
+app = create_app()